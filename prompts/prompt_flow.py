@@ -4,15 +4,200 @@ Prompt Flow Reader - Read multiple prompt/instruction files in order
 
 This module provides utilities to read and process prompt and instruction files
 from the GitHub Copilot Playbook repository in a structured manner.
+
+Frontmatter and flow configurations are parsed with PyYAML's libyaml-backed
+CSafeLoader when PyYAML was built with libyaml (install libyaml before
+PyYAML to get it), falling back to the pure-Python SafeLoader otherwise.
 """
 
+import io
 import os
+import re
+import sys
+import json
+import mmap
 import yaml
 import argparse
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Mapping, Optional, TextIO, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+INSTRUCTION_SUFFIX = ".instructions.md"
+PROMPT_SUFFIX = ".prompt.md"
+DOCUMENT_SUFFIX = ".md"
+
+# Frontmatter index kept in the base directory between runs
+INDEX_FILENAME = ".promptflow_index.json"
+
+# Bytes read from the start of a file when looking for frontmatter
+HEAD_SIZE = 4096
+
+# Bodies at least this large are decoded from a memory mapping
+MMAP_THRESHOLD = 64 * 1024
+
+# Most processed files kept in a reader's cache before evicting the least
+# recently used one
+FILE_CACHE_SIZE = 4096
+
+# Dataclasses drop the per-instance __dict__ where slots are supported (3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Loaded flow configs as (mtime_ns, config), keyed by absolute config path
+_config_cache: Dict[str, Tuple[int, 'FlowConfig']] = {}
+
+# Frontmatter starts with a '---' line at the very start of the file and
+# ends at the next line that is exactly '---'
+_FRONTMATTER_OPENINGS = (b'---\n', b'---\r\n')
+_FRONTMATTER_CLOSING = b'\n---'
+
+# A top-level 'key: value' frontmatter line with a plain identifier key
+_SIMPLE_FRONTMATTER_LINE_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_]*) *:(?: +(.*?))? *\Z')
+
+# Characters outside the printable set handled by the simple parser
+_YAML_UNSAFE_CHAR_RE = re.compile('[^\n\r\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]')
+
+# Words YAML resolves to booleans, nulls or special values instead of strings
+_YAML_SPECIAL_WORDS = frozenset(
+    word
+    for base in ('yes', 'no', 'true', 'false', 'on', 'off', 'null')
+    for word in (base, base.capitalize(), base.upper())
+) | {'~', '=', '<<'}
+
+# Plain scalars starting with these are indicators, numbers or dates in YAML
+_YAML_PLAIN_UNSAFE_START = frozenset('-?:,[]{}#&*!|>\'"%@`+.0123456789~')
+
+# Characters that make a glob pattern match more than one literal path
+_GLOB_MAGIC_RE = re.compile(r'[*?[]')
+
+def _walk_order_key(rel_path: str) -> List[str]:
+    """Sort key putting relative file paths in the order the tree walk yields them"""
+    return rel_path.split('/')
+
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Translate a pathlib-style glob pattern into a regular expression
+    
+    Unlike fnmatch.translate, '*' and '?' never match across '/' and a
+    '**' segment matches zero or more whole directories.
+    
+    Args:
+        pattern: Glob pattern relative to the base path (e.g. "docs/**/*.md")
+        
+    Returns:
+        Regular expression source matching POSIX-style relative paths
+    """
+    segments = pattern.split('/')
+    regex = []
+    
+    for i, segment in enumerate(segments):
+        is_last = i == len(segments) - 1
+        if segment == '**':
+            regex.append('.*' if is_last else '(?:.+/)?')
+            continue
+        
+        j = 0
+        while j < len(segment):
+            c = segment[j]
+            j += 1
+            if c == '*':
+                regex.append('[^/]*')
+            elif c == '?':
+                regex.append('[^/]')
+            elif c == '[':
+                # Bracket expressions follow fnmatch rules ('!' negates)
+                end = j
+                if segment[end:end + 1] == '!':
+                    end += 1
+                if segment[end:end + 1] == ']':
+                    end += 1
+                end = segment.find(']', end)
+                if end == -1:
+                    regex.append('\\[')
+                    continue
+                chars = segment[j:end].replace('\\', '\\\\')
+                if chars[0] == '!':
+                    chars = '^' + chars[1:]
+                elif chars[0] == '^':
+                    chars = '\\' + chars
+                regex.append(f'[{chars}]')
+                j = end + 1
+            else:
+                regex.append(re.escape(c))
+        
+        if not is_last:
+            regex.append('/')
+    
+    return '(?s:' + ''.join(regex) + r')\Z'
+
+def _parse_simple_frontmatter(text: str) -> Optional[Dict]:
+    """
+    Parse frontmatter made only of 'key: scalar' lines without PyYAML
+    
+    Handles plain, single-quoted (with '' escapes) and double-quoted string
+    values. Anything YAML would read differently (numbers, booleans, nulls,
+    lists, nesting, backslash escapes, anchors, ...) makes this return None
+    so the caller can fall back to the YAML loader.
+    
+    Args:
+        text: Frontmatter text between the '---' delimiters
+        
+    Returns:
+        Dictionary of string keys to string (or None) values, or None if the
+        text is not in the simple subset
+    """
+    # Tabs, unusual line breaks and control characters are left to PyYAML
+    if _YAML_UNSAFE_CHAR_RE.search(text):
+        return None
+    
+    frontmatter = {}
+    
+    for line in text.split('\n'):
+        if line.endswith('\r'):
+            line = line[:-1]
+        if '\r' in line:
+            return None
+        # Only ASCII spaces are blank to YAML; NBSP and friends are content
+        stripped = line.strip(' ')
+        if not stripped or stripped.startswith('#'):
+            continue
+        
+        match = _SIMPLE_FRONTMATTER_LINE_RE.match(line)
+        if not match:
+            return None
+        key, value = match.groups()
+        if key in _YAML_SPECIAL_WORDS:
+            return None
+        
+        if not value:
+            frontmatter[key] = None
+        elif value[0] == "'":
+            # Inside single quotes YAML's only escape is '' for a quote
+            inner = value[1:-1]
+            if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+                return None
+            frontmatter[key] = inner.replace("''", "'")
+        elif value[0] == '"':
+            if len(value) < 2 or value[-1] != '"' or '"' in value[1:-1] or '\\' in value:
+                return None
+            frontmatter[key] = value[1:-1]
+        elif (value[0] in _YAML_PLAIN_UNSAFE_START or value in _YAML_SPECIAL_WORDS
+              or value.endswith(':') or ': ' in value or ' #' in value):
+            return None
+        else:
+            frontmatter[key] = value
+    
+    return frontmatter or None
 
 class FileType(Enum):
     """Enumeration for different file types"""
@@ -20,7 +205,7 @@ class FileType(Enum):
     INSTRUCTION = "instruction"
     DOCUMENT = "document"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FileMetadata:
     """Metadata extracted from file frontmatter"""
     file_type: FileType
@@ -30,37 +215,239 @@ class FileMetadata:
     description: Optional[str] = None
     raw_frontmatter: Optional[Dict] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessedFile:
     """Container for a processed file with metadata and content"""
     file_path: Path
     metadata: FileMetadata
     content: str
     frontmatter: Optional[Dict] = None
+    
+    def read_content(self) -> str:
+        """Return the content; subclasses that load it lazily do so without caching it"""
+        return self.content
+
+class LazyProcessedFile(ProcessedFile):
+    """
+    ProcessedFile whose content is read from disk on first access
+    
+    Only the frontmatter is parsed up front; the body starts at body_offset
+    bytes into the file and is decoded when content is first used. If the
+    body bytes were already read they are kept and decoded instead.
+    Otherwise the body is only read if the file still has the mtime and
+    size it had when the frontmatter was parsed.
+    
+    Unlike its slotted base class it keeps an instance __dict__, which
+    cached_property needs to store the decoded content.
+    """
+    
+    def __init__(self, file_path: Path, metadata: FileMetadata, body_offset: int,
+                 mtime_ns: int, size: int, frontmatter: Optional[Dict] = None,
+                 body: Optional[bytes] = None):
+        self.file_path = file_path
+        self.metadata = metadata
+        self.frontmatter = frontmatter
+        self.body_offset = body_offset
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self._body = body
+    
+    @cached_property
+    def content(self) -> str:
+        """File content without frontmatter, with newlines normalized to '\\n'"""
+        data, self._body = self._body, None
+        if data is not None:
+            return _normalize_newlines(data.decode('utf-8'))
+        return _read_body(self.file_path, self.body_offset, self.mtime_ns, self.size)
+    
+    def read_content(self) -> str:
+        """
+        Return the content without caching it on the object
+        
+        Use this instead of content when the text is only needed briefly,
+        so that a cached file does not keep its decoded content alive.
+        """
+        if 'content' in self.__dict__:
+            return self.__dict__['content']
+        if self._body is not None:
+            return _normalize_newlines(self._body.decode('utf-8'))
+        return _read_body(self.file_path, self.body_offset, self.mtime_ns, self.size)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
+class FileIndex:
+    """
+    Metadata of many files stored column-wise
+    
+    Row i of every list describes the same file. Contents are not kept
+    here, except the raw body bytes of small files that the frontmatter
+    scan already read whole; use a ContentStore to load them on demand.
+    """
+    paths: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    file_types: List[FileType] = field(default_factory=list)
+    apply_to: List[Optional[str]] = field(default_factory=list)
+    modes: List[Optional[str]] = field(default_factory=list)
+    models: List[Optional[str]] = field(default_factory=list)
+    descriptions: List[Optional[str]] = field(default_factory=list)
+    body_offsets: List[int] = field(default_factory=list)
+    mtimes_ns: List[int] = field(default_factory=list)
+    sizes: List[int] = field(default_factory=list)
+    bodies: List[Optional[bytes]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def append(self, category: str, file_path: str, metadata: FileMetadata, body_offset: int,
+               stat: os.stat_result, body: Optional[bytes] = None) -> None:
+        """Add a row for a file in the given category"""
+        self.paths.append(file_path)
+        self.categories.append(category)
+        self.file_types.append(metadata.file_type)
+        self.apply_to.append(metadata.apply_to)
+        self.modes.append(metadata.mode)
+        self.models.append(metadata.model)
+        self.descriptions.append(metadata.description)
+        self.body_offsets.append(body_offset)
+        self.mtimes_ns.append(stat.st_mtime_ns)
+        self.sizes.append(stat.st_size)
+        self.bodies.append(body)
+    
+    def rows(self, category: str) -> List[int]:
+        """Row numbers of the files in a category, in index order"""
+        return [row for row, row_category in enumerate(self.categories) if row_category == category]
+
+class ContentStore:
+    """
+    Loads file contents for a FileIndex on demand, keyed by row number
+    
+    Contents are not kept: each access decodes the retained body bytes or
+    reads the body from disk, so only the contents in use stay in memory.
+    """
+    
+    def __init__(self, index: FileIndex):
+        self.index = index
+    
+    def __getitem__(self, row: int) -> str:
+        index = self.index
+        body = index.bodies[row]
+        if body is not None:
+            return _normalize_newlines(body.decode('utf-8'))
+        return _read_body(index.paths[row], index.body_offsets[row],
+                          index.mtimes_ns[row], index.sizes[row])
+    
+    def processed_file(self, row: int) -> ProcessedFile:
+        """
+        Build a ProcessedFile for a row, with its content loaded
+        
+        The frontmatter is not part of the index, so frontmatter and
+        metadata.raw_frontmatter are None.
+        """
+        index = self.index
+        metadata = FileMetadata(
+            file_type=index.file_types[row],
+            apply_to=index.apply_to[row],
+            mode=index.modes[row],
+            model=index.models[row],
+            description=index.descriptions[row]
+        )
+        return ProcessedFile(file_path=Path(index.paths[row]), metadata=metadata, content=self[row])
+
+def _normalize_newlines(content: str) -> str:
+    """Convert '\\r\\n' and '\\r' line endings to '\\n', as text mode reading does"""
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def _read_body(file_path: Union[str, os.PathLike], body_offset: int,
+               mtime_ns: int, size: int) -> str:
+    """
+    Read and decode a file's content from body_offset on
+    
+    body_offset is only valid for the file version whose frontmatter was
+    parsed, so the file must still have that mtime and size. Large bodies
+    are decoded straight from a memory mapping, without an intermediate
+    bytes copy.
+    
+    Args:
+        file_path: Path to the file
+        body_offset: Byte offset at which the content starts
+        mtime_ns: Modification time of the file when body_offset was found
+        size: Size of the file when body_offset was found
+        
+    Returns:
+        Content with newlines normalized to '\\n'
+        
+    Raises:
+        IOError: If file can't be read or has changed since it was parsed
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+                raise IOError("file changed since its frontmatter was parsed; read it again")
+            if size - body_offset < MMAP_THRESHOLD:
+                f.seek(body_offset)
+                content = f.read().decode('utf-8')
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view, view[body_offset:] as body:
+                    content = str(body, 'utf-8')
+    except IOError as e:
+        raise IOError(f"Failed to read file {file_path}: {e}")
+    
+    return _normalize_newlines(content)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FlowConfig:
-    """Configuration loaded from YAML flow file"""
+    """
+    Configuration loaded from YAML flow file
+    
+    Instances are deeply immutable: nested mappings are read-only
+    MappingProxyType views and lists become tuples, so a cached config can
+    be shared between readers. Configs compare by value but are not
+    hashable.
+    """
     name: str
     version: str = "1.0.0"
     description: str = ""
-    config: Dict = None
-    flow: List[Dict] = None
-    file_patterns: Dict = None
-    output: Dict = None
-    execution: Dict = None
+    config: Mapping = None
+    flow: Tuple[Mapping, ...] = None
+    file_patterns: Mapping = None
+    output: Mapping = None
+    execution: Mapping = None
+    
+    # Field values are mappings, so a generated hash would always fail
+    __hash__ = None
     
     def __post_init__(self):
+        # Frozen dataclass, so fields are set through object.__setattr__
         if self.config is None:
-            self.config = {}
-        if self.flow is None:
-            self.flow = []
+            object.__setattr__(self, 'config', {})
+        object.__setattr__(self, 'flow', tuple(self.flow or ()))
         if self.file_patterns is None:
-            self.file_patterns = {"include": [], "exclude": []}
+            object.__setattr__(self, 'file_patterns', {"include": (), "exclude": ()})
+        else:
+            # A missing list (e.g. 'exclude:' left empty) means no patterns
+            # and a single string means one pattern
+            object.__setattr__(self, 'file_patterns', {
+                key: () if patterns is None else (patterns,) if isinstance(patterns, str) else tuple(patterns)
+                for key, patterns in self.file_patterns.items()
+            })
         if self.output is None:
-            self.output = {"format": "combined"}
+            object.__setattr__(self, 'output', {"format": "combined"})
         if self.execution is None:
-            self.execution = {"model": "Claude Sonnet 4 (copilot)", "mode": "agent"}
+            object.__setattr__(self, 'execution', {"model": "Claude Sonnet 4 (copilot)", "mode": "agent"})
+        
+        for name in ('config', 'flow', 'file_patterns', 'output', 'execution'):
+            object.__setattr__(self, name, _freeze(getattr(self, name)))
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of parsed YAML: mappings as MappingProxyType, lists as tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 class PromptFlowReader:
     """
@@ -82,24 +469,38 @@ class PromptFlowReader:
         
         self.config = config
         
+        # Paths are handled as plain strings internally; prefix of every
+        # path found by walking base_path
+        self._base_prefix = os.path.join(str(self.base_path), '')
+        
+        # Compiled union regex per list of glob patterns
+        self._pattern_cache: Dict[Tuple[str, ...], re.Pattern] = {}
+        
+        # Processed files as (mtime_ns, size, file) keyed by case-normalized
+        # path, in LRU order; the lock guards it against concurrent reads in the executor
+        self._file_cache: 'OrderedDict[str, Tuple[int, int, ProcessedFile]]' = OrderedDict()
+        self._file_cache_lock = threading.Lock()
+        
+        # Thread pool for file reads, created on first use (see _executor)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        
         # Define common file patterns (can be overridden by config)
-        self.instruction_patterns = [
-            ".github/instructions/**/*.instructions.md",
-            "instructions/**/*.instructions.md",
-            "**/*.instructions.md"
-        ]
+        self.instruction_patterns = ["**/*.instructions.md"]
         
-        self.prompt_patterns = [
-            ".github/prompts/**/*.prompt.md", 
-            "prompts/**/*.prompt.md",
-            "**/*.prompt.md"
-        ]
+        self.prompt_patterns = ["**/*.prompt.md"]
         
         self.doc_patterns = [
             "docs/**/*.md",
             "*.md"
         ]
         
+        # Documents are only taken from this many directory levels below the
+        # base path (docs/a/b/*.md is depth 3), and never from hidden directories
+        self.doc_max_depth = 3
+        
+        self.config_patterns = []
+        self.exclude_patterns = []
+        
         # Override patterns if config is provided
         if self.config and self.config.file_patterns:
             if "include" in self.config.file_patterns:
@@ -107,15 +508,48 @@ class PromptFlowReader:
                 self.config_patterns = self.config.file_patterns["include"]
             if "exclude" in self.config.file_patterns:
                 self.exclude_patterns = self.config.file_patterns["exclude"]
-        else:
-            self.config_patterns = []
-            self.exclude_patterns = []
+        
+        # Exclude patterns are checked for every file and directory walked,
+        # so they are compiled once; directories matched by a pattern ending
+        # in '/**' are excluded as a whole
+        self._exclude_regex = self._compile_patterns(self.exclude_patterns)
+        self._exclude_dir_regex = self._compile_patterns([
+            pattern[:-len('/**')] for pattern in self.exclude_patterns
+            if pattern.endswith('/**')
+        ])
+    
+    def __enter__(self) -> 'PromptFlowReader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Shut down the thread pool used for concurrent reads
+        
+        The reader stays usable; a new pool is created if more files are read.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool for concurrent file reads, created on first use"""
+        # File reads release the GIL, so a thread pool overlaps their latency
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+        return self._pool
     
     @classmethod
     def load_config(cls, config_file: Path) -> FlowConfig:
         """
         Load configuration from YAML file
         
+        Loaded configs are cached per path and reused until the file's
+        modification time changes.
+        
         Args:
             config_file: Path to the YAML configuration file
             
@@ -126,14 +560,21 @@ class PromptFlowReader:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file has invalid YAML
         """
-        if not config_file.exists():
+        try:
+            mtime_ns = os.stat(config_file).st_mtime_ns
+        except OSError:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         
+        cache_key = os.path.normcase(os.path.abspath(config_file))
+        cached = _config_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_SafeLoader)
             
-            return FlowConfig(
+            config = FlowConfig(
                 name=config_data.get('name', 'unnamed_flow'),
                 version=config_data.get('version', '1.0.0'),
                 description=config_data.get('description', ''),
@@ -145,13 +586,22 @@ class PromptFlowReader:
             )
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in config file {config_file}: {e}")
+        
+        _config_cache[cache_key] = (mtime_ns, config)
+        return config
     
-    def execute_flow(self) -> Dict[str, any]:
+    def execute_flow(self, verbose: bool = False, out_fh: Optional[TextIO] = None) -> Dict[str, any]:
         """
         Execute the configured flow steps in order
         
+        Args:
+            verbose: Print the combined prompt context
+            out_fh: Text stream the combined prompt context is written to
+                instead of being returned in the results
+            
         Returns:
-            Dictionary containing execution results
+            Dictionary containing execution results; files_processed maps
+            each successful step to its file's path, type and content length
         """
         if not self.config or not self.config.flow:
             print("⚠️  No flow configuration found. Running default behavior.")
@@ -169,6 +619,10 @@ class PromptFlowReader:
             'combined_context': ''
         }
         
+        # Prompt files to combine, by step; they are read again while
+        # combining instead of being kept here
+        prompt_paths = {}
+        
         for i, step in enumerate(self.config.flow, 1):
             step_name = step.get('step', f'step_{i}')
             step_type = step.get('type', 'unknown')
@@ -183,19 +637,32 @@ class PromptFlowReader:
             print(f"   Required: {required}")
             
             try:
-                # Process the file if it exists
-                full_path = self.base_path / file_path
-                if full_path.exists():
-                    processed_file = self.read_file(full_path)
-                    results['files_processed'][step_name] = processed_file
+                # Process the file if it exists; read_file's stat doubles as the check
+                try:
+                    processed_file = self.read_file(self.base_path / file_path)
+                except FileNotFoundError:
+                    processed_file = None
+                
+                if processed_file is not None:
+                    # read_content leaves no decoded text on the cached file
+                    content_length = len(processed_file.read_content())
+                    results['files_processed'][step_name] = {
+                        'file_path': processed_file.file_path,
+                        'file_type': processed_file.metadata.file_type,
+                        'content_length': content_length
+                    }
+                    if processed_file.metadata.file_type == FileType.PROMPT:
+                        prompt_paths[step_name] = processed_file.file_path
+                    else:
+                        prompt_paths.pop(step_name, None)
                     results['steps_executed'].append({
                         'step': step_name,
                         'type': step_type,
                         'file': file_path,
                         'status': 'success',
-                        'content_length': len(processed_file.content)
+                        'content_length': content_length
                     })
-                    print(f"   ✅ Processed successfully ({len(processed_file.content)} chars)")
+                    print(f"   ✅ Processed successfully ({content_length} chars)")
                 else:
                     if required:
                         print(f"   ❌ Required file not found: {file_path}")
@@ -227,79 +694,142 @@ class PromptFlowReader:
                 })
         
         # Generate combined context for prompt files
-        prompt_files = [f for f in results['files_processed'].values() 
-                       if f.metadata.file_type == FileType.PROMPT]
-        
-        if prompt_files:
-            results['combined_context'] = self.append_and_print_prompt_context(prompt_files)
+        if prompt_paths:
+            results['combined_context'] = self.append_and_print_prompt_context(
+                self._read_prompt_steps(prompt_paths, results), verbose=verbose, out_fh=out_fh
+            )
         
         print(f"\n✅ Flow execution completed: {len(results['steps_executed'])} steps processed")
         return results
     
+    def _read_prompt_steps(self, prompt_paths: Dict[str, Path],
+                           results: Dict[str, any]) -> Iterable[ProcessedFile]:
+        """
+        Read the prompt files of a flow again, one at a time, for combining
+        
+        A file that can no longer be read is reported and its step is marked
+        as failed in results instead of aborting the flow.
+        
+        Args:
+            prompt_paths: Prompt file path of each step, in step order
+            results: Flow results whose step entries are updated on errors
+            
+        Yields:
+            ProcessedFile objects with their content loaded
+        """
+        for step_name, path in prompt_paths.items():
+            try:
+                processed_file = self.read_file(path)
+                content = processed_file.read_content()
+            except IOError as e:
+                print(f"   ❌ Error reading prompt for step {step_name}: {e}")
+                results['files_processed'].pop(step_name, None)
+                for step_result in reversed(results['steps_executed']):
+                    if step_result['step'] == step_name:
+                        step_result.pop('content_length', None)
+                        step_result.update(status='error', error=str(e))
+                        break
+                continue
+            
+            yield ProcessedFile(
+                file_path=processed_file.file_path,
+                metadata=processed_file.metadata,
+                content=content,
+                frontmatter=processed_file.frontmatter
+            )
+    
     def _execute_default_flow(self) -> Dict[str, any]:
         """Execute default behavior when no config is provided"""
         return {'flow_name': 'default', 'files_processed': self.read_all_files()}
     
-    def _extract_frontmatter(self, content: str) -> Tuple[Optional[Dict], str]:
+    def _extract_frontmatter(self, f: BinaryIO) -> Tuple[Optional[Dict], int, bytes]:
         """
-        Extract YAML frontmatter from markdown content
+        Extract YAML frontmatter from an open markdown file
+        
+        The head of the file is read as bytes. Files that do not start with
+        a '---' line are rejected by a prefix check; otherwise the closing
+        delimiter is located with bytes.find, reading more of the file only
+        while it is missing. The body is left on disk.
         
         Args:
-            content: Raw file content
+            f: Binary file object positioned at the start of the file
             
         Returns:
-            Tuple of (frontmatter_dict, content_without_frontmatter)
+            Tuple of (frontmatter_dict, body_offset, data) where body_offset
+            is the byte offset at which the content without frontmatter
+            starts and data holds the bytes read from the start of the file
         """
-        lines = content.split('\n')
+        data = f.read(HEAD_SIZE)
+        at_eof = len(data) < HEAD_SIZE
         
-        # Check if file starts with frontmatter delimiter
-        if not lines or lines[0].strip() != '---':
-            return None, content
+        if not data.startswith(_FRONTMATTER_OPENINGS):
+            return None, 0, data
         
-        # Find end of frontmatter
-        end_idx = None
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == '---':
-                end_idx = i
-                break
+        # Search from the opening line's newline so empty frontmatter matches
+        text_start = data.index(b'\n') + 1
+        search_from = text_start - 1
         
-        if end_idx is None:
-            return None, content
-        
-        try:
-            # Parse YAML frontmatter
-            frontmatter_text = '\n'.join(lines[1:end_idx])
-            frontmatter = yaml.safe_load(frontmatter_text) if frontmatter_text.strip() else {}
-            
-            # Return content without frontmatter
-            remaining_content = '\n'.join(lines[end_idx + 1:])
-            return frontmatter, remaining_content
+        while True:
+            pos = data.find(_FRONTMATTER_CLOSING, search_from)
+            if pos != -1:
+                end = pos + len(_FRONTMATTER_CLOSING)
+                if data.startswith(b'\r', end):
+                    end += 1
+                if data.startswith(b'\n', end):
+                    body_offset = end + 1
+                    break
+                if end < len(data):
+                    # '---' followed by more text; keep looking
+                    search_from = pos + 1
+                    continue
+                if at_eof:
+                    body_offset = end
+                    break
+                # The candidate line may continue past what was read so far
+                search_from = pos
+            elif at_eof:
+                return None, 0, data
+            else:
+                search_from = max(search_from, len(data) - len(_FRONTMATTER_CLOSING))
             
-        except yaml.YAMLError:
-            return None, content
+            more = f.read(len(data))
+            at_eof = len(more) < len(data)
+            data += more
+        
+        frontmatter_text = data[text_start:pos].decode('utf-8')
+        
+        # Most frontmatter is a few 'key: value' lines; skip YAML for those
+        frontmatter = _parse_simple_frontmatter(frontmatter_text)
+        if frontmatter is None:
+            try:
+                # Parse YAML frontmatter
+                frontmatter = yaml.load(frontmatter_text, Loader=_SafeLoader) if frontmatter_text.strip() else {}
+            except yaml.YAMLError:
+                return None, 0, data
+        
+        return frontmatter, body_offset, data
     
-    def _determine_file_type(self, file_path: Path, frontmatter: Optional[Dict]) -> FileType:
+    def _determine_file_type(self, file_path: Path, fields: Dict) -> FileType:
         """
         Determine the file type based on path and frontmatter
         
         Args:
             file_path: Path to the file
-            frontmatter: Parsed frontmatter dictionary
+            fields: Frontmatter dictionary with lowercased keys
             
         Returns:
             FileType enum value
         """
-        file_name = file_path.name.lower()
+        file_name = file_path.name
         
-        if '.instructions.md' in file_name:
+        if file_name.endswith(INSTRUCTION_SUFFIX):
+            return FileType.INSTRUCTION
+        elif file_name.endswith(PROMPT_SUFFIX):
+            return FileType.PROMPT
+        elif 'applyto' in fields:
             return FileType.INSTRUCTION
-        elif '.prompt.md' in file_name:
+        elif 'mode' in fields or 'model' in fields:
             return FileType.PROMPT
-        elif frontmatter:
-            if 'applyTo' in frontmatter or 'applyto' in frontmatter:
-                return FileType.INSTRUCTION
-            elif 'mode' in frontmatter or 'model' in frontmatter:
-                return FileType.PROMPT
         
         return FileType.DOCUMENT
     
@@ -307,6 +837,8 @@ class PromptFlowReader:
         """
         Create FileMetadata from frontmatter
         
+        Frontmatter keys are matched case-insensitively (applyTo/applyto).
+        
         Args:
             file_path: Path to the file
             frontmatter: Parsed frontmatter dictionary
@@ -314,24 +846,34 @@ class PromptFlowReader:
         Returns:
             FileMetadata object
         """
-        file_type = self._determine_file_type(file_path, frontmatter)
+        # Normalize keys once instead of probing each spelling
+        if isinstance(frontmatter, dict):
+            fields = {k.lower() if isinstance(k, str) else k: v for k, v in frontmatter.items()}
+        else:
+            fields = {}
+        
+        file_type = self._determine_file_type(file_path, fields)
         
         if not frontmatter:
             return FileMetadata(file_type=file_type)
         
         return FileMetadata(
             file_type=file_type,
-            apply_to=frontmatter.get('applyTo') or frontmatter.get('applyto'),
-            mode=frontmatter.get('mode'),
-            model=frontmatter.get('model'),
-            description=frontmatter.get('description'),
+            apply_to=fields.get('applyto'),
+            mode=fields.get('mode'),
+            model=fields.get('model'),
+            description=fields.get('description'),
             raw_frontmatter=frontmatter
         )
     
-    def read_file(self, file_path: Path) -> ProcessedFile:
+    def read_file(self, file_path: Union[str, os.PathLike]) -> ProcessedFile:
         """
         Read and process a single file
         
+        Only the frontmatter is read here; the content is loaded from disk
+        the first time it is accessed. Results are cached until the file's
+        modification time or size changes.
+        
         Args:
             file_path: Path to the file to read
             
@@ -342,24 +884,350 @@ class PromptFlowReader:
             FileNotFoundError: If file doesn't exist
             IOError: If file can't be read
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        file_path = os.fspath(file_path)
+        return self._process_file(file_path, self._stat_file(file_path))
+    
+    def _stat_file(self, file_path: str) -> os.stat_result:
+        """
+        Stat a file, raising the same errors as read_file
         
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            os.stat_result for the file
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            return os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}")
         except IOError as e:
             raise IOError(f"Failed to read file {file_path}: {e}")
+    
+    def _process_file(self, file_path: str, stat: os.stat_result,
+                      index_entry: Optional[Dict] = None) -> ProcessedFile:
+        """
+        Build the ProcessedFile for an already stat'ed file
+        
+        Args:
+            file_path: Path to the file
+            stat: Result of stat'ing file_path
+            index_entry: Up-to-date index entry for the file; when given the
+                file is not opened at all
+            
+        Returns:
+            ProcessedFile object
+        """
+        # Reuse the previous result while the file is unchanged; the key is
+        # case-normalized so differently cased spellings of a path on
+        # case-insensitive filesystems share one entry
+        cache_key = os.path.normcase(file_path)
+        with self._file_cache_lock:
+            cached = self._file_cache.get(cache_key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._file_cache.move_to_end(cache_key)
+                return cached[2]
         
-        frontmatter, clean_content = self._extract_frontmatter(content)
-        metadata = self._create_metadata(file_path, frontmatter)
+        frontmatter, body_offset, body = self._frontmatter_for(file_path, stat, index_entry)
         
-        return ProcessedFile(
-            file_path=file_path,
+        path = Path(file_path)
+        metadata = self._create_metadata(path, frontmatter)
+        
+        processed_file = LazyProcessedFile(
+            file_path=path,
             metadata=metadata,
-            content=clean_content,
-            frontmatter=frontmatter
+            body_offset=body_offset,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            frontmatter=frontmatter,
+            body=body
         )
+        with self._file_cache_lock:
+            self._file_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, processed_file)
+            self._file_cache.move_to_end(cache_key)
+            if len(self._file_cache) > FILE_CACHE_SIZE:
+                self._file_cache.popitem(last=False)
+        return processed_file
+    
+    def _frontmatter_for(self, file_path: str, stat: os.stat_result,
+                         index_entry: Optional[Dict]) -> Tuple[Optional[Dict], int, Optional[bytes]]:
+        """
+        Get a file's frontmatter from its index entry, or from the file
+        
+        Args:
+            file_path: Path to the file
+            stat: Result of stat'ing file_path
+            index_entry: Up-to-date index entry for the file, or None
+            
+        Returns:
+            Tuple of (frontmatter_dict, body_offset, body) as returned by
+            _read_frontmatter; body is None when the index entry was used
+        """
+        if index_entry is not None:
+            return index_entry['frontmatter'], index_entry['body_offset'], None
+        return self._read_frontmatter(file_path, stat)
+    
+    def _read_frontmatter(self, file_path: str,
+                          stat: os.stat_result) -> Tuple[Optional[Dict], int, Optional[bytes]]:
+        """
+        Open a file and extract its frontmatter
+        
+        Args:
+            file_path: Path to the file
+            stat: Result of stat'ing file_path
+            
+        Returns:
+            Tuple of (frontmatter_dict, body_offset, body) where body holds
+            the body bytes if the frontmatter scan read the whole file
+            
+        Raises:
+            IOError: If file can't be read
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                frontmatter, body_offset, data = self._extract_frontmatter(f)
+        except IOError as e:
+            raise IOError(f"Failed to read file {file_path}: {e}")
+        
+        # Small files are read whole by the frontmatter scan; keep the
+        # body bytes so content does not need a second open and read
+        body = data[body_offset:] if len(data) == stat.st_size else None
+        return frontmatter, body_offset, body
+    
+    def _load_index(self) -> Dict[str, Dict]:
+        """
+        Load the frontmatter index written by a previous run
+        
+        Returns:
+            Dictionary mapping POSIX-style relative paths to index entries,
+            empty if there is no usable index
+        """
+        try:
+            with open(self.base_path / INDEX_FILENAME, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (IOError, ValueError):
+            return {}
+        
+        return index if isinstance(index, dict) else {}
+    
+    def _write_index(self, index: Dict[str, Dict]) -> Path:
+        """
+        Atomically write the frontmatter index
+        
+        Args:
+            index: Dictionary mapping relative paths to index entries
+            
+        Returns:
+            Path of the index file
+        """
+        index_path = self.base_path / INDEX_FILENAME
+        tmp_path = index_path.with_name(index_path.name + '.tmp')
+        
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, sort_keys=True)
+            os.replace(tmp_path, index_path)
+        except IOError as e:
+            print(f"Warning: Could not write index {index_path}: {e}")
+        
+        return index_path
+    
+    def _lookup_index(self, file_path: str,
+                      index: Dict[str, Dict]) -> Tuple[str, os.stat_result, Optional[Dict]]:
+        """
+        Stat a file and find its index entry
+        
+        Args:
+            file_path: Path to the file, inside base_path
+            index: Index loaded from disk
+            
+        Returns:
+            Tuple of (key, stat, entry) where key is the file's POSIX-style
+            relative path and entry is None unless it matches the file's
+            current mtime and size and is well formed
+        """
+        if file_path.startswith(self._base_prefix):
+            key = file_path[len(self._base_prefix):]
+        else:
+            key = os.path.relpath(file_path, self.base_path)
+        if os.sep != '/':
+            key = key.replace(os.sep, '/')
+        stat = self._stat_file(file_path)
+        
+        # The index file is only a cache; anything malformed or stale in it
+        # means the file is parsed again
+        entry = index.get(key)
+        if not isinstance(entry, dict) or entry.get('mtime_ns') != stat.st_mtime_ns \
+                or entry.get('size') != stat.st_size:
+            entry = None
+        elif not isinstance(entry.get('frontmatter', False), (dict, type(None))):
+            entry = None
+        else:
+            body_offset = entry.get('body_offset')
+            if type(body_offset) is not int or not 0 <= body_offset <= stat.st_size:
+                entry = None
+        
+        return key, stat, entry
+    
+    def _update_index(self, new_index: Dict[str, Dict], key: str, stat: os.stat_result,
+                      entry: Optional[Dict], frontmatter: Optional[Dict], body_offset: int) -> None:
+        """
+        Store a file's entry in the index being built
+        
+        Args:
+            new_index: Index being built
+            key: POSIX-style relative path of the file
+            stat: Result of stat'ing the file
+            entry: Up-to-date entry from the old index, or None to build one
+            frontmatter: Parsed frontmatter of the file
+            body_offset: Byte offset at which the file's content starts
+        """
+        if entry is None:
+            entry = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'frontmatter': frontmatter,
+                'body_offset': body_offset
+            }
+            # Only index frontmatter that survives a JSON round trip unchanged
+            try:
+                if json.loads(json.dumps(frontmatter)) != frontmatter:
+                    return
+            except (TypeError, ValueError):
+                return
+        
+        new_index[key] = entry
+    
+    def _index_processed_file(self, file_path: str, stat: os.stat_result,
+                              index_entry: Optional[Dict]) -> Tuple[ProcessedFile, Optional[Dict], int]:
+        """
+        Per-file reader for _read_all_indexed that builds a ProcessedFile
+        
+        Returns:
+            Tuple of (processed_file, frontmatter_dict, body_offset)
+        """
+        processed_file = self._process_file(file_path, stat, index_entry)
+        return processed_file, processed_file.frontmatter, processed_file.body_offset
+    
+    def _index_row(self, file_path: str, stat: os.stat_result,
+                   index_entry: Optional[Dict]) -> Tuple[Tuple, Optional[Dict], int]:
+        """
+        Per-file reader for _read_all_indexed that builds a FileIndex row
+        
+        The file cache is bypassed, so no ProcessedFile is built or kept.
+        
+        Returns:
+            Tuple of (row, frontmatter_dict, body_offset) where row holds the
+            arguments for FileIndex.append after the category
+        """
+        frontmatter, body_offset, body = self._frontmatter_for(file_path, stat, index_entry)
+        metadata = self._create_metadata(Path(file_path), frontmatter)
+        return (file_path, metadata, body_offset, stat, body), frontmatter, body_offset
+    
+    def _read_all_indexed(self, read_one: Callable[[str, os.stat_result, Optional[Dict]], Tuple[Any, Optional[Dict], int]]
+                          ) -> Tuple[Dict[str, List[Any]], Dict[str, Dict], bool]:
+        """
+        Read all discovered files through the frontmatter index
+        
+        Args:
+            read_one: Called as read_one(file_path, stat, index_entry) for
+                each file, with index_entry None unless it is up to date;
+                returns (result, frontmatter_dict, body_offset)
+            
+        Returns:
+            Tuple of (results_by_category, new_index, index_changed)
+        """
+        found_files = self._scan_once()
+        index = self._load_index()
+        new_index = {}
+        
+        def read(file_path: str) -> Any:
+            key, stat, entry = self._lookup_index(file_path, index)
+            result, frontmatter, body_offset = read_one(file_path, stat, entry)
+            self._update_index(new_index, key, stat, entry, frontmatter, body_offset)
+            return result
+        
+        all_results = {
+            category: list(self._executor.map(read, file_paths))
+            for category, file_paths in found_files.items()
+        }
+        return all_results, new_index, new_index != index
+    
+    def build_index(self) -> Path:
+        """
+        Write the frontmatter index for every discovered file
+        
+        The index stores each file's mtime, size, frontmatter and body offset
+        so later runs can skip parsing files that have not changed.
+        
+        Returns:
+            Path of the index file
+        """
+        _, new_index, _ = self._read_all_indexed(self._index_row)
+        return self._write_index(new_index)
+    
+    def _list_dir(self, dir_path: str) -> List[Tuple[str, str, bool]]:
+        """
+        List a directory's files and subdirectories
+        
+        File types come from the directory entry, so no extra stat call is
+        needed except for symlinks. Listings are not cached: each walk sees
+        the directory as it is now, so added and deleted files are noticed
+        by a long-lived reader.
+        
+        Args:
+            dir_path: Directory to list
+            
+        Returns:
+            Sorted list of (name, path, is_dir) tuples
+        """
+        entries = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.name, entry.path, True))
+                    elif entry.is_file():
+                        entries.append((entry.name, entry.path, False))
+        except OSError:
+            pass
+        
+        entries.sort()
+        return entries
+    
+    def _walk_files(self):
+        """
+        Walk the base directory depth-first in sorted order
+        
+        Each directory's files and subdirectories are visited interleaved in
+        name order, so paths come out ordered by their components, the same
+        order as sorting them as Path objects. Files matching
+        exclude_patterns are skipped. Directories excluded as a whole by a
+        pattern ending in '/**' (e.g. '**/node_modules/**') are not entered
+        at all.
+        
+        Yields:
+            Tuples of (relative_dir, name, path) for every file, where
+            relative_dir is the POSIX-style directory relative to base_path
+            ('' for the base directory itself)
+        """
+        exclude_regex = self._exclude_regex
+        exclude_dir_regex = self._exclude_dir_regex
+        # Stack of (relative_dir, iterator over the directory's entries)
+        stack = [('', iter(self._list_dir(str(self.base_path))))]
+        
+        while stack:
+            rel_dir, entries = stack[-1]
+            for name, path, is_dir in entries:
+                if is_dir:
+                    if not exclude_dir_regex.match(rel_dir + name):
+                        # Descend now; the rest of this directory follows
+                        stack.append((f"{rel_dir}{name}/", iter(self._list_dir(path))))
+                        break
+                elif not exclude_regex.match(rel_dir + name):
+                    yield rel_dir, name, path
+            else:
+                stack.pop()
     
     def find_files_by_pattern(self, patterns: List[str]) -> List[Path]:
         """
@@ -369,16 +1237,96 @@ class PromptFlowReader:
             patterns: List of glob patterns to search for
             
         Returns:
-            List of Path objects for matching files
+            Sorted list of Path objects for matching files
+        """
+        return [Path(path) for path in self._find_paths(patterns)]
+    
+    def _find_paths(self, patterns: List[str]) -> List[str]:
         """
-        found_files = []
+        Find files matching the given glob patterns, as path strings
         
-        for pattern in patterns:
-            found_files.extend(self.base_path.glob(pattern))
+        When no pattern contains a wildcard, each one names a single file
+        that is checked directly instead of walking the tree.
         
-        # Remove duplicates and sort
-        unique_files = sorted(set(found_files))
-        return [f for f in unique_files if f.is_file()]
+        Args:
+            patterns: List of glob patterns to search for
+            
+        Returns:
+            Sorted list of matching file paths
+        """
+        if not any(_GLOB_MAGIC_RE.search(pattern) for pattern in patterns):
+            found = []
+            # Same order as the walk: by path components
+            for pattern in sorted(set(patterns), key=_walk_order_key):
+                path = os.path.join(str(self.base_path), *pattern.split('/'))
+                if os.path.isfile(path) and not self._exclude_regex.match(pattern):
+                    found.append(path)
+            return found
+        
+        regex = self._compile_patterns(patterns)
+        
+        return [
+            path for rel_dir, name, path in self._walk_files()
+            if regex.match(rel_dir + name)
+        ]
+    
+    def _compile_patterns(self, patterns: List[str]) -> re.Pattern:
+        """
+        Compile glob patterns into a single cached regex
+        
+        Args:
+            patterns: List of glob patterns
+            
+        Returns:
+            Compiled regex matching a relative path if any pattern matches
+        """
+        key = tuple(patterns)
+        regex = self._pattern_cache.get(key)
+        if regex is None:
+            regex = re.compile('|'.join(_glob_to_regex(pattern) for pattern in patterns) or '(?!)')
+            self._pattern_cache[key] = regex
+        return regex
+    
+    def _scan_once(self) -> Dict[str, List[str]]:
+        """
+        Walk the base directory once and bucket markdown files by suffix
+        
+        Instructions and prompts are collected from the whole tree, documents
+        only where they match doc_patterns, lie at most doc_max_depth
+        directories deep and are not inside a hidden directory.
+        
+        Returns:
+            Dictionary with keys 'instructions', 'prompts', 'documents'
+            and corresponding sorted lists of file paths
+        """
+        buckets = {'instructions': [], 'prompts': [], 'documents': []}
+        doc_regex = self._compile_patterns(self.doc_patterns)
+        
+        for rel_dir, name, path in self._walk_files():
+            if not name.endswith(DOCUMENT_SUFFIX):
+                continue
+            elif name.endswith(INSTRUCTION_SUFFIX):
+                buckets['instructions'].append(path)
+            elif name.endswith(PROMPT_SUFFIX):
+                buckets['prompts'].append(path)
+            elif (rel_dir.count('/') <= self.doc_max_depth
+                  and not rel_dir.startswith('.') and '/.' not in rel_dir
+                  and doc_regex.match(rel_dir + name)):
+                buckets['documents'].append(path)
+        
+        return buckets
+    
+    def _read_files(self, file_paths: List[str]) -> List[ProcessedFile]:
+        """
+        Read several files concurrently, keeping their order
+        
+        Args:
+            file_paths: Paths of the files to read
+            
+        Returns:
+            List of ProcessedFile objects in the same order as file_paths
+        """
+        return list(self._executor.map(self.read_file, file_paths))
     
     def read_instruction_files(self) -> List[ProcessedFile]:
         """
@@ -387,8 +1335,8 @@ class PromptFlowReader:
         Returns:
             List of ProcessedFile objects for instruction files
         """
-        instruction_files = self.find_files_by_pattern(self.instruction_patterns)
-        return [self.read_file(f) for f in instruction_files]
+        instruction_files = self._find_paths(self.instruction_patterns)
+        return self._read_files(instruction_files)
     
     def read_prompt_files(self) -> List[ProcessedFile]:
         """
@@ -397,33 +1345,51 @@ class PromptFlowReader:
         Returns:
             List of ProcessedFile objects for prompt files
         """
-        prompt_files = self.find_files_by_pattern(self.prompt_patterns)
-        return [self.read_file(f) for f in prompt_files]
+        prompt_files = self._find_paths(self.prompt_patterns)
+        return self._read_files(prompt_files)
     
     def read_all_files(self) -> Dict[str, List[ProcessedFile]]:
         """
         Read all prompt, instruction, and document files
         
+        Frontmatter of files unchanged since the last run is taken from the
+        index file in base_path; the index is rewritten when it is stale.
+        
         Returns:
             Dictionary with keys 'instructions', 'prompts', 'documents'
             and corresponding lists of ProcessedFile objects
         """
-        instructions = self.read_instruction_files()
-        prompts = self.read_prompt_files()
+        all_files, new_index, index_changed = self._read_all_indexed(self._index_processed_file)
+        
+        if index_changed:
+            self._write_index(new_index)
+        
+        return all_files
+    
+    def read_file_index(self) -> FileIndex:
+        """
+        Read the metadata of all prompt, instruction, and document files
+        
+        Like read_all_files, but the result is a column-wise FileIndex; pair
+        it with a ContentStore to load contents. The index keeps no decoded
+        contents, only the raw body bytes of small files that the
+        frontmatter scan already read whole. Files are not read through
+        read_file, so no ProcessedFile objects are built or cached.
         
-        # Find additional document files
-        doc_files = self.find_files_by_pattern(self.doc_patterns)
+        Returns:
+            FileIndex with one row per file, in the order instructions,
+            prompts, documents
+        """
+        all_rows, new_index, index_changed = self._read_all_indexed(self._index_row)
         
-        # Filter out files already processed as instructions/prompts
-        processed_paths = {f.file_path for f in instructions + prompts}
-        remaining_docs = [f for f in doc_files if f not in processed_paths]
-        documents = [self.read_file(f) for f in remaining_docs]
+        if index_changed:
+            self._write_index(new_index)
         
-        return {
-            'instructions': instructions,
-            'prompts': prompts,
-            'documents': documents
-        }
+        file_index = FileIndex()
+        for category, rows in all_rows.items():
+            for row in rows:
+                file_index.append(category, *row)
+        return file_index
     
     def read_files_in_order(self, file_paths: List[str]) -> List[ProcessedFile]:
         """
@@ -435,106 +1401,216 @@ class PromptFlowReader:
         Returns:
             List of ProcessedFile objects in the specified order
         """
+        def try_read(file_path: Path) -> Tuple[Optional[ProcessedFile], Optional[Exception]]:
+            try:
+                return self.read_file(file_path), None
+            except (FileNotFoundError, IOError) as e:
+                return None, e
+        
+        full_paths = [self.base_path / file_path_str for file_path_str in file_paths]
         processed_files = []
         
-        for file_path_str in file_paths:
-            file_path = self.base_path / file_path_str
-            try:
-                processed_file = self.read_file(file_path)
+        for file_path, (processed_file, error) in zip(full_paths, self._executor.map(try_read, full_paths)):
+            if error is not None:
+                print(f"Warning: Could not read {file_path}: {error}")
+            else:
                 processed_files.append(processed_file)
-            except (FileNotFoundError, IOError) as e:
-                print(f"Warning: Could not read {file_path}: {e}")
         
         return processed_files
     
-    def print_file_summary(self, processed_file: ProcessedFile) -> None:
+    def print_file_summary(self, processed_file: ProcessedFile, out: Optional[TextIO] = None) -> None:
         """
         Print a summary of a processed file
         
         Args:
             processed_file: ProcessedFile to summarize
+            out: Stream to write the summary to (default: sys.stdout). Pass a
+                buffer such as io.StringIO to batch many summaries into one write.
         """
-        print(f"\n📄 {processed_file.file_path.name}")
-        print(f"   Path: {processed_file.file_path}")
-        print(f"   Type: {processed_file.metadata.file_type.value}")
-        
-        if processed_file.metadata.apply_to:
-            print(f"   Applies to: {processed_file.metadata.apply_to}")
-        if processed_file.metadata.mode:
-            print(f"   Mode: {processed_file.metadata.mode}")
-        if processed_file.metadata.model:
-            print(f"   Model: {processed_file.metadata.model}")
-        if processed_file.metadata.description:
-            print(f"   Description: {processed_file.metadata.description}")
-        
-        content_length = len(processed_file.content)
-        print(f"   Content length: {content_length} characters")
+        metadata = processed_file.metadata
+        (out or sys.stdout).write(_format_summary(
+            processed_file.file_path, metadata.file_type, metadata.apply_to,
+            metadata.mode, metadata.model, metadata.description, processed_file.content
+        ))
+    
+    def print_index_summary(self, index: FileIndex, row: int, contents: Optional[ContentStore] = None,
+                            out: Optional[TextIO] = None) -> None:
+        """
+        Print a summary of one file of a FileIndex
         
-        # Show first few lines of content
-        lines = processed_file.content.strip().split('\n')[:3]
-        if lines and lines[0]:
-            print(f"   Preview: {lines[0][:80]}{'...' if len(lines[0]) > 80 else ''}")
+        Args:
+            index: FileIndex holding the file's metadata
+            row: Row number of the file in the index
+            contents: ContentStore for the index; content length and preview
+                are only printed when given
+            out: Stream to write the summary to (default: sys.stdout)
+        """
+        (out or sys.stdout).write(_format_summary(
+            index.paths[row], index.file_types[row], index.apply_to[row],
+            index.modes[row], index.models[row], index.descriptions[row],
+            contents[row] if contents is not None else None
+        ))
     
-    def append_and_print_prompt_context(self, prompt_files: List[ProcessedFile]) -> str:
+    def append_and_print_prompt_context(self, prompt_files: Iterable[ProcessedFile],
+                                        verbose: bool = False,
+                                        out_fh: Optional[TextIO] = None) -> str:
         """
         Append the context of all prompt files and print the combined content
         
+        The printed report is collected in a buffer and written to stdout
+        with a single write. Prompt contents are printed once, as part of the
+        final combined context, and only in verbose mode. prompt_files is
+        consumed in a single pass, so it can be a generator that reads each
+        file as it is needed.
+        
         Args:
-            prompt_files: List of ProcessedFile objects for prompt files
+            prompt_files: ProcessedFile objects for prompt files
+            verbose: Print the final combined context
+            out_fh: Text stream the combined context is written to chunk by
+                chunk as it is produced; it is then only kept in memory when
+                verbose mode needs to print it
             
         Returns:
-            Combined context string of all prompt files
+            Combined context string of all prompt files, or an empty string
+            when it was written to out_fh
         """
-        if not prompt_files:
-            print("\n🚫 No prompt files found to append.")
-            return ""
+        out = io.StringIO()
+        out.write("\n" + "=" * 70 + "\n")
+        out.write("🔗 COMBINED PROMPT CONTEXT\n")
+        out.write("=" * 70 + "\n")
         
-        print("\n" + "=" * 70)
-        print("🔗 COMBINED PROMPT CONTEXT")
-        print("=" * 70)
-        
-        combined_context = []
+        combined_context = io.StringIO() if out_fh is None or verbose else None
+        writes = [stream.write for stream in (out_fh, combined_context) if stream is not None]
+        total_length = 0
+        count = 0
         
         for i, prompt_file in enumerate(prompt_files, 1):
-            print(f"\n📋 Prompt {i}: {prompt_file.file_path.name}")
-            print("-" * 50)
+            count = i
+            out.write(f"\n📋 Prompt {i}: {prompt_file.file_path.name}\n")
+            out.write("-" * 50 + "\n")
             
             # Add file header to context
-            header = f"# Prompt {i}: {prompt_file.file_path.name}\n"
-            header += f"# Path: {prompt_file.file_path}\n"
-            
-            if prompt_file.metadata.description:
-                header += f"# Description: {prompt_file.metadata.description}\n"
-            if prompt_file.metadata.mode:
-                header += f"# Mode: {prompt_file.metadata.mode}\n"
-            if prompt_file.metadata.model:
-                header += f"# Model: {prompt_file.metadata.model}\n"
+            md = prompt_file.metadata
+            parts = [
+                f"# Prompt {i}: {prompt_file.file_path.name}\n",
+                f"# Path: {prompt_file.file_path}\n"
+            ]
             
-            header += "\n"
+            if md.description:
+                parts.append(f"# Description: {md.description}\n")
+            if md.mode:
+                parts.append(f"# Mode: {md.mode}\n")
+            if md.model:
+                parts.append(f"# Model: {md.model}\n")
+            parts.append("\n\n")
             
-            combined_context.append(header)
-            combined_context.append(prompt_file.content)
-            combined_context.append("\n" + "─" * 50 + "\n")
+            # Separators are written with each chunk, so the context is
+            # streamed out without a final join
+            content = prompt_file.read_content()
+            chunks = ("\n" if i > 1 else "", ''.join(parts), content, "\n\n" + "─" * 50 + "\n")
+            for chunk in chunks:
+                for write in writes:
+                    write(chunk)
+                total_length += len(chunk)
             
-            # Print the content
-            print(f"📄 Content ({len(prompt_file.content)} characters):")
-            print(prompt_file.content)
-            print("─" * 50)
+            out.write(f"📄 Content ({len(content)} characters)\n")
+        
+        if not count:
+            print("\n🚫 No prompt files found to append.")
+            return ""
         
-        # Join all contexts
-        final_context = "\n".join(combined_context)
+        final_context = combined_context.getvalue() if combined_context is not None else ""
         
-        print(f"\n✅ Combined {len(prompt_files)} prompt files")
-        print(f"📊 Total combined length: {len(final_context)} characters")
+        out.write(f"\n✅ Combined {count} prompt files\n")
+        out.write(f"📊 Total combined length: {total_length} characters\n")
         
         # Print the final combined context
-        print("\n" + "=" * 70)
-        print("📝 FINAL COMBINED PROMPT CONTEXT")
-        print("=" * 70)
-        print(final_context)
+        if verbose:
+            out.write("\n" + "=" * 70 + "\n")
+            out.write("📝 FINAL COMBINED PROMPT CONTEXT\n")
+            out.write("=" * 70 + "\n")
+            out.write(final_context + "\n")
+        
+        sys.stdout.write(out.getvalue())
+        return final_context if out_fh is None else ""
+
+
+def _format_summary(file_path: Union[str, os.PathLike], file_type: FileType, apply_to: Optional[str],
+                    mode: Optional[str], model: Optional[str], description: Optional[str],
+                    content: Optional[str]) -> str:
+    """
+    Format the summary printed for a file
+    
+    Returns:
+        Summary text, one field per line
+    """
+    lines = [
+        f"\n📄 {os.path.basename(file_path)}",
+        f"   Path: {file_path}",
+        f"   Type: {file_type.value}"
+    ]
+    
+    if apply_to:
+        lines.append(f"   Applies to: {apply_to}")
+    if mode:
+        lines.append(f"   Mode: {mode}")
+    if model:
+        lines.append(f"   Model: {model}")
+    if description:
+        lines.append(f"   Description: {description}")
+    
+    if content is not None:
+        lines.append(f"   Content length: {len(content)} characters")
         
-        return final_context
+        # Show first few lines of content
+        preview = content.strip().split('\n')[:3]
+        if preview and preview[0]:
+            lines.append(f"   Preview: {preview[0][:80]}{'...' if len(preview[0]) > 80 else ''}")
+    
+    lines.append("")
+    return "\n".join(lines)
+
+def _open_output(output_file: Path) -> Optional[TextIO]:
+    """
+    Open a temporary file next to the combined context output file
+    
+    The combined context is streamed into it and moved into place by
+    _close_output, so an existing output file is only replaced once the
+    new one is complete.
+    
+    Returns:
+        Open text file, or None (after reporting the error) if it can't be opened
+    """
+    try:
+        return open(f"{output_file}.tmp", 'w', encoding='utf-8')
+    except IOError as e:
+        print(f"\n❌ Failed to save combined context: {e}")
+        return None
 
+def _close_output(out_fh: TextIO, output_file: Path, completed: bool) -> bool:
+    """
+    Close a file opened by _open_output and move it into place
+    
+    Args:
+        out_fh: File returned by _open_output
+        output_file: Final path of the combined context
+        completed: Whether the combined context was written completely
+        
+    Returns:
+        True if the output file was saved; False if nothing was written or
+        writing did not complete, in which case the temporary file is removed
+    """
+    saved = completed and out_fh.tell() > 0
+    out_fh.close()
+    try:
+        if saved:
+            os.replace(out_fh.name, output_file)
+        else:
+            os.remove(out_fh.name)
+    except OSError as e:
+        print(f"\n❌ Failed to save combined context: {e}")
+        return False
+    return saved
 
 def parse_args():
     """
@@ -611,6 +1687,7 @@ def main():
             return 1
     
     # Initialize reader
+    reader = None
     try:
         reader = PromptFlowReader(base_path=args.base_path, config=config)
         
@@ -626,51 +1703,59 @@ def main():
         
         # Execute flow or default behavior
         if config:
-            results = reader.execute_flow()
+            # Save results if configured, streaming them into the output file
+            output_file = reader.base_path / "combined_prompt_context.md"
+            out_fh = _open_output(output_file) if config.output.get('format') == 'combined' else None
+            completed = False
+            try:
+                reader.execute_flow(verbose=args.verbose or bool(config.config.get('verbose')), out_fh=out_fh)
+                completed = True
+            finally:
+                saved = out_fh is not None and _close_output(out_fh, output_file, completed)
             
-            # Save results if configured
-            if config.output.get('format') == 'combined' and results.get('combined_context'):
-                output_file = reader.base_path / "combined_prompt_context.md"
-                try:
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(results['combined_context'])
-                    print(f"\n💾 Combined context saved to: {output_file}")
-                except IOError as e:
-                    print(f"\n❌ Failed to save combined context: {e}")
+            if saved:
+                print(f"\n💾 Combined context saved to: {output_file}")
             
         else:
             # Default behavior - read all files
             print("\n📂 Running in default mode (no flow configuration)")
-            all_files = reader.read_all_files()
+            index = reader.read_file_index()
+            contents = ContentStore(index)
             
-            # Display summary
-            for category, files in all_files.items():
-                print(f"\n📁 {category.upper()} ({len(files)} files)")
-                print("-" * 30)
+            # Display summary, buffered and written at once
+            summary = io.StringIO()
+            for category in ('instructions', 'prompts', 'documents'):
+                rows = index.rows(category)
+                summary.write(f"\n📁 {category.upper()} ({len(rows)} files)\n")
+                summary.write("-" * 30 + "\n")
                 
                 if args.verbose:
-                    for processed_file in files:
-                        reader.print_file_summary(processed_file)
+                    for row in rows:
+                        reader.print_index_summary(index, row, contents, out=summary)
                 else:
                     # Show only file names in non-verbose mode
-                    for processed_file in files:
-                        print(f"   📄 {processed_file.file_path.name}")
+                    for row in rows:
+                        summary.write(f"   📄 {os.path.basename(index.paths[row])}\n")
+            sys.stdout.write(summary.getvalue())
             
-            print(f"\n✅ Total files processed: {sum(len(files) for files in all_files.values())}")
+            print(f"\n✅ Total files processed: {len(index)}")
             
-            # Process prompts
-            prompt_files = all_files.get('prompts', [])
-            if prompt_files:
-                combined_prompt_context = reader.append_and_print_prompt_context(prompt_files)
+            # Process prompts, loading each one's content only while it is combined
+            prompt_rows = index.rows('prompts')
+            if prompt_rows:
+                prompt_files = (contents.processed_file(row) for row in prompt_rows)
                 
-                # Save combined context
+                # Save combined context, streaming it into the output file
                 output_file = reader.base_path / "combined_prompt_context.md"
+                out_fh = _open_output(output_file)
+                completed = False
                 try:
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(combined_prompt_context)
+                    reader.append_and_print_prompt_context(prompt_files, verbose=args.verbose, out_fh=out_fh)
+                    completed = True
+                finally:
+                    saved = out_fh is not None and _close_output(out_fh, output_file, completed)
+                if saved:
                     print(f"\n💾 Combined prompt context saved to: {output_file}")
-                except IOError as e:
-                    print(f"\n❌ Failed to save combined context: {e}")
             else:
                 print("\n🚫 No prompt files found to combine.")
         
@@ -682,9 +1767,11 @@ def main():
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        if reader is not None:
+            reader.close()
 
 
 if __name__ == "__main__":
-    import sys
     exit_code = main()
     sys.exit(exit_code)
\ No newline at end of file
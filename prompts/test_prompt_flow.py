@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Differential tests for the hand-written parts of prompt_flow
+
+The simple frontmatter parser must agree with PyYAML and the glob
+translation must agree with pathlib. Run with:
+
+    python -m unittest discover -s prompts
+"""
+
+import os
+import re
+import sys
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from prompt_flow import PromptFlowReader, _SafeLoader, _glob_to_regex, _parse_simple_frontmatter
+
+# Building blocks for generated frontmatter, biased towards YAML corner cases
+KEYS = ['mode', 'applyTo', 'description', 'yes', '_k', 'x1', 'null', 'a b', '  ind', '#c', '']
+SEPARATORS = [': ', ':', ' : ', ':\t', ':  ']
+ATOMS = [
+    "''", "'''", "'a''b'", 'a', 'agent', 'yes', 'No', 'null', '~', '1', '1.5', '-', '- a',
+    '"q"', "'s'", '"a\\nb"', '#', ' #c', 'a#b', ':', ': ', 'x:', '**', '*.ts', '[a]', '{b}',
+    '&a', '!t', '|', '>', '%', '@', '`', 'Claude Sonnet 4 (copilot)', '2024-01-01', '0x1f',
+    '.inf', '=', '<<', ' ', '\t', '\xa0', ' ', 'é', '"', "'", '\\', 'http://u.v', 'True'
+]
+LINE_ENDS = ['', '', ' ', '\r', '\xa0']
+
+
+class SimpleFrontmatterTest(unittest.TestCase):
+    """_parse_simple_frontmatter either declines or matches yaml.load"""
+
+    def assert_matches_yaml(self, text):
+        result = _parse_simple_frontmatter(text)
+        if result is None:
+            return
+        try:
+            expected = yaml.load(text, Loader=_SafeLoader)
+        except yaml.YAMLError:
+            self.fail(f"parsed {text!r} as {result!r}, but YAML rejects it")
+        self.assertEqual(result, expected, repr(text))
+        for key, value in result.items():
+            self.assertIs(type(value), type(expected[key]), repr(text))
+
+    def test_known_cases(self):
+        cases = [
+            'mode: agent\ndescription: Do things',
+            "description: 'it''s fine'",
+            'applyTo: "**/*.ts"',
+            'mode: agent\n\xa0\n',
+            'mode: agent\n   # comment\n',
+            'mode: yes',
+            'model:',
+            'a: b: c',
+            'x: 1',
+        ]
+        for text in cases:
+            self.assert_matches_yaml(text)
+
+        self.assertEqual(_parse_simple_frontmatter("description: 'it''s fine'"),
+                         {'description': "it's fine"})
+        # YAML treats NBSP as content, so a line of it is not blank
+        self.assertIsNone(_parse_simple_frontmatter('mode: agent\n\xa0\n'))
+
+    def test_generated_cases(self):
+        rng = random.Random(0)
+        for _ in range(20000):
+            lines = []
+            for _ in range(rng.randint(1, 4)):
+                value = ''.join(rng.choice(ATOMS) for _ in range(rng.randint(0, 3)))
+                lines.append(rng.choice(KEYS) + rng.choice(SEPARATORS) + value + rng.choice(LINE_ENDS))
+            self.assert_matches_yaml('\n'.join(lines))
+
+
+class GlobTest(unittest.TestCase):
+    """Glob patterns select the same files as Path.glob, in sorted Path order"""
+
+    FILES = [
+        'README.md', 'notes.txt', '.github/x/q.prompt.md', '.github/instructions/a.instructions.md',
+        'a/b.prompt.md', 'a/c/d.prompt.md', 'a/c.d/e.prompt.md', 'a/c.prompt.md', 'a/z.prompt.md',
+        'docs/guide.md', 'docs/deep/er/x.md', 'docs/[x].md', 'src/a1.ts', 'src/ab.ts',
+    ]
+    # Before Python 3.13 a trailing '**' makes Path.glob return only
+    # directories, so such patterns are checked separately below
+    PATTERNS = [
+        '*.md', '**/*.md', '**/*.prompt.md', 'a/*/*.md', 'docs/**/*.md', 'src/a?.ts',
+        'src/[a-b]*.ts', 'src/[!a]*.ts', 'docs/[[]x].md', '**/c/*', '.github/**/*.md',
+    ]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        for name in self.FILES:
+            path = self.base / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('x\n', encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_path_glob(self):
+        reader = PromptFlowReader(base_path=str(self.base))
+        try:
+            for pattern in self.PATTERNS:
+                expected = sorted(p for p in self.base.glob(pattern) if p.is_file())
+                self.assertEqual(reader.find_files_by_pattern([pattern]), expected, pattern)
+        finally:
+            reader.close()
+
+    def test_regex_on_relative_paths(self):
+        for pattern in self.PATTERNS:
+            regex = re.compile(_glob_to_regex(pattern))
+            expected = {p.relative_to(self.base).as_posix()
+                        for p in self.base.glob(pattern) if p.is_file()}
+            matched = {name for name in self.FILES if regex.match(name)}
+            self.assertEqual(matched, expected, pattern)
+
+    def test_trailing_double_star_matches_files(self):
+        # As in Python 3.13's pathlib, 'dir/**' also matches the files below
+        # dir, which is what exclude patterns like '**/node_modules/**' need
+        regex = re.compile(_glob_to_regex('a/**'))
+        matched = sorted(name for name in self.FILES if regex.match(name))
+        self.assertEqual(matched, sorted(name for name in self.FILES if name.startswith('a/')))
+
+
+if __name__ == '__main__':
+    unittest.main()